@@ -3,99 +3,521 @@
 Simple Python client for testing the Rust MCP Server
 """
 
+import argparse
+import functools
 import json
+import os
+import selectors
+import signal
+import socket
 import subprocess
 import time
-from typing import Dict, Any, Optional
+from typing import BinaryIO, Callable, Dict, Any, List, Optional, Set, Tuple, Union
+
+try:
+    # orjson works on bytes directly, so nothing is decoded or re-encoded
+    import orjson
+    _dumps: Callable[[Any], bytes] = orjson.dumps
+    _loads: Callable[[Any], Any] = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def _loads(data: Any) -> Any:
+        # json.loads does not take memoryviews
+        return json.loads(bytes(data))
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore[assignment]
+
+# Release build of the server, relative to the examples directory
+SERVER_BINARY = "../target/release/rust-mcp-server"
+
+# Parameters sent with the initialize request
+INIT_PARAMS: Dict[str, Any] = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {},
+    "clientInfo": {
+        "name": "python-test-client",
+        "version": "1.0.0"
+    }
+}
+
+# Bytes requested per read(); large enough for most tool results in one call
+READ_BUFFER_SIZE = 64 * 1024
+
+# Capacity requested for the server's stdout pipe; Linux defaults to 64 KiB
+PIPE_CAPACITY = 1 << 20
+
+
+def _grow_pipe(fd: int) -> None:
+    """Enlarge a pipe so a big response never blocks the server mid-write (Linux only)"""
+    if fcntl is None:
+        return
+    size = PIPE_CAPACITY
+    try:
+        with open("/proc/sys/fs/pipe-max-size") as f:
+            size = min(size, int(f.read()))
+    except (OSError, ValueError):
+        pass
+    try:
+        fcntl.fcntl(fd, getattr(fcntl, "F_SETPIPE_SZ", 1031), size)
+    except OSError:
+        pass
+
+
+def _request_template(method: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+    """Pre-encode a request line, leaving a %d placeholder for its id"""
+    request: Dict[str, Any] = {"jsonrpc": "2.0", "method": method}
+    if params is not None:
+        request["params"] = params
+    return _dumps(request)[:-1].replace(b"%", b"%%") + b',"id":%d}\n'
+
+
+# How long start_server waits for the first ping reply
+STARTUP_TIMEOUT = 2.0
+
+
+class _SpawnedServer:
+    """Minimal Popen stand-in for a server started with os.posix_spawn
+
+    posix_spawn avoids most of Popen's Python-level setup and, on Linux,
+    uses a vfork-style clone instead of copying the client's page tables.
+    """
+
+    def __init__(self, args: List[str], pipe_stdio: bool) -> None:
+        self.stdin: Optional[BinaryIO] = None
+        self.stdout: Optional[BinaryIO] = None
+        self.returncode: Optional[int] = None
+
+        child_fds: List[int] = []
+        if pipe_stdio:
+            stdin_r, stdin_w = os.pipe()
+            stdout_r, stdout_w = os.pipe()
+            child_fds = [stdin_r, stdout_w]
+            file_actions: List[Tuple[Any, ...]] = [
+                (os.POSIX_SPAWN_DUP2, stdin_r, 0),
+                (os.POSIX_SPAWN_DUP2, stdout_w, 1),
+            ]
+        else:
+            file_actions = [
+                (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            ]
+        # Nothing reads the server's stderr, so don't give it a pipe to fill up
+        file_actions.append((os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0))
+
+        try:
+            self.pid = os.posix_spawn(args[0], args, os.environ, file_actions=file_actions)
+        except OSError:
+            if pipe_stdio:
+                os.close(stdin_w)
+                os.close(stdout_r)
+            raise
+        finally:
+            for fd in child_fds:
+                os.close(fd)
+
+        if pipe_stdio:
+            self.stdin = open(stdin_w, "wb")
+            self.stdout = open(stdout_r, "rb")
+
+    def poll(self) -> Optional[int]:
+        """Return the exit code if the server has exited, else None"""
+        if self.returncode is None:
+            pid, status = os.waitpid(self.pid, os.WNOHANG)
+            if pid:
+                self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def terminate(self) -> None:
+        """Send SIGTERM unless the server has already exited"""
+        if self.poll() is None:
+            os.kill(self.pid, signal.SIGTERM)
+
+    def wait(self) -> int:
+        """Reap the server, close its pipes and return the exit code"""
+        if self.returncode is None:
+            _, status = os.waitpid(self.pid, 0)
+            self.returncode = os.waitstatus_to_exitcode(status)
+        for pipe in (self.stdin, self.stdout):
+            if pipe is not None:
+                try:
+                    pipe.close()
+                except BrokenPipeError:
+                    # A request the server exited without reading is still buffered
+                    pass
+        return self.returncode
+
 
 class McpClient:
-    def __init__(self) -> None:
+    # Fixed-shape requests are encoded once; only the id changes per call
+    _TMPL_INITIALIZE = _request_template("initialize", INIT_PARAMS)
+    _TMPL_INITIALIZED = _request_template("initialized")
+    _TMPL_LIST_TOOLS = _request_template("tools/list")
+    _TMPL_PING = _request_template("ping")
+    # Method -> (params the template was built with, template)
+    _TEMPLATES = {
+        "initialize": (INIT_PARAMS, _TMPL_INITIALIZE),
+        "initialized": (None, _TMPL_INITIALIZED),
+        "tools/list": (None, _TMPL_LIST_TOOLS),
+        "ping": (None, _TMPL_PING),
+    }
+
+    def __init__(self, socket_path: Optional[str] = None) -> None:
         self.next_id = 1
-        self.process: Optional[subprocess.Popen[str]] = None
+        # When set, the server listens on this Unix domain socket instead of stdio
+        self.socket_path = socket_path
+        self.process: Optional[Union[_SpawnedServer, "subprocess.Popen[bytes]"]] = None
+        self._sock: Optional[socket.socket] = None
+        self._write: Optional[Callable[[bytes], None]] = None
+        # Responses are read with _read into _buf and parsed into _responses by id
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._read: Callable[[], bytes] = bytes
+        self._buf = bytearray()
+        self._scan = 0
+        self._responses: Dict[Any, Dict[str, Any]] = {}
+        # Ids whose replies are still wanted; replies for any other id are dropped
+        self._outstanding: Set[int] = set()
 
     def start_server(self) -> bool:
-        """Start the MCP server process with minimal logging"""
+        """Start the MCP server process with minimal logging
+
+        With a socket_path, a server already listening there (started with
+        --daemon) is reused and no process is spawned.
+        """
+        if self.socket_path is not None and self._connect_socket(self.socket_path, timeout=0):
+            if self._wait_until_ready():
+                print(f"Using server already listening on {self.socket_path}")
+                return True
+            # Something is listening there; spawning over it would take its socket
+            print(f"Server listening on {self.socket_path} did not answer ping")
+            self.stop_server()
+            return False
+
+        # Use the release binary directly with quiet flag
+        args = [SERVER_BINARY, "--quiet"]
+        if self.socket_path is not None:
+            args += ["--socket", self.socket_path]
+        pipe_stdio = self.socket_path is None
+
         try:
-            # Use the release binary directly with quiet flag
-            self.process = subprocess.Popen(
-                ["../target/release/rust-mcp-server", "--quiet"],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            time.sleep(0.1)  # Give server time to start
-            return True
+            if hasattr(os, "posix_spawn"):
+                self.process = _SpawnedServer(args, pipe_stdio)
+            else:
+                stdio = subprocess.PIPE if pipe_stdio else subprocess.DEVNULL
+                self.process = subprocess.Popen(
+                    args,
+                    stdin=stdio,
+                    stdout=stdio,
+                    stderr=subprocess.DEVNULL,
+                )
         except Exception as e:
             print(f"Failed to start server: {e}")
             print("Make sure you've built the release binary with: cargo build --release")
             return False
 
+        if pipe_stdio:
+            self._attach_pipes()
+        elif not self._connect_socket(self.socket_path):
+            print(f"Could not connect to server socket {self.socket_path}")
+            self.stop_server()
+            return False
+
+        if not self._wait_until_ready():
+            print("Server did not answer ping during startup")
+            self.stop_server()
+            return False
+        return True
+
+    def _attach_pipes(self) -> None:
+        """Talk to the server over its stdin/stdout pipes"""
+        assert self.process is not None
+        stdin, stdout = self.process.stdin, self.process.stdout
+        assert stdin is not None and stdout is not None
+
+        def write(data: bytes) -> None:
+            stdin.write(data)
+            stdin.flush()
+
+        self._write = write
+        # Only the read end is non-blocking; writes still block until complete
+        fd = stdout.fileno()
+        _grow_pipe(fd)
+        os.set_blocking(fd, False)
+        self._watch(fd, functools.partial(os.read, fd, READ_BUFFER_SIZE))
+
+    def _connect_socket(self, path: str, timeout: float = STARTUP_TIMEOUT) -> bool:
+        """Connect to the server's Unix domain socket once it is listening"""
+        deadline = time.monotonic() + timeout
+        delay = 0.001
+        while True:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(path)
+                break
+            except OSError:
+                sock.close()
+                if self.process is not None and self.process.poll() is not None:
+                    return False
+                if time.monotonic() >= deadline:
+                    return False
+                # There is nothing to block on until the socket exists
+                time.sleep(delay)
+                delay = min(delay * 2, 0.1)
+
+        self._sock = sock
+        self._write = sock.sendall
+        # MSG_DONTWAIT keeps reads non-blocking while sendall() stays blocking
+        self._watch(sock.fileno(), functools.partial(sock.recv, READ_BUFFER_SIZE, socket.MSG_DONTWAIT))
+        return True
+
+    def _watch(self, fd: int, read: Callable[[], bytes]) -> None:
+        """Register the descriptor that server responses arrive on
+
+        read must not block: it returns what is available or raises
+        BlockingIOError.
+        """
+        self._read = read
+        self._buf = bytearray()
+        self._scan = 0
+        self._responses = {}
+        self._outstanding = set()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(fd, selectors.EVENT_READ)
+
+    def _wait_until_ready(self, timeout: float = STARTUP_TIMEOUT) -> bool:
+        """Send a ping and block until the server replies to it"""
+        # The transport holds the ping until the server starts reading, so
+        # one request is enough. A server that exits closes its end, which
+        # ends the wait with a ConnectionError instead of a timeout.
+        try:
+            ping_id = self.send_async("ping")
+            return ping_id in self.collect([ping_id], timeout=timeout)
+        except OSError:
+            return False
+
     def stop_server(self) -> None:
-        """Stop the MCP server process"""
+        """Stop the MCP server process, or just disconnect from a reused daemon"""
+        self._write = None
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+        if self._sock:
+            self._sock.close()
+            self._sock = None
         if self.process:
             self.process.terminate()
             self.process.wait()
             self.process = None
 
-    def send_request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Send a JSON-RPC request to the server and return the response"""
-        if not self.process:
-            return {"error": "Server not started"}
+    def __enter__(self) -> "McpClient":
+        """Start the server once and reuse it for every request in the block"""
+        if self._write is None and not self.start_server():
+            raise RuntimeError("Failed to start MCP server")
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop_server()
 
-        request = {
+    def _next_request_id(self) -> int:
+        """Allocate the id for the next request and wait for its reply"""
+        request_id = self.next_id
+        self.next_id += 1
+        self._outstanding.add(request_id)
+        return request_id
+
+    def _encode_request(self, method: str, params: Optional[Dict[str, Any]]) -> Tuple[int, bytes]:
+        """Encode a request line with the next free id, from a template when one matches"""
+        request_id = self._next_request_id()
+        template = self._TEMPLATES.get(method)
+        if template is not None and template[0] == params:
+            return request_id, template[1] % request_id
+
+        request: Dict[str, Any] = {
             "jsonrpc": "2.0",
-            "id": self.next_id,
+            "id": request_id,
             "method": method,
         }
 
         if params is not None:
             request["params"] = params
 
-        self.next_id += 1
-
-        try:
-            # Send request
-            request_json = json.dumps(request)
-            if self.process.stdin is None:
-                return {"error": "Server stdin not available"}
-            self.process.stdin.write(request_json + "\n")
-            self.process.stdin.flush()
-
-            # Read response
-            if self.process.stdout is None:
-                return {"error": "Server stdout not available"}
-            response_line = self.process.stdout.readline()
-            if not response_line.strip():
-                return {"error": "No response from server"}
+        return request_id, _dumps(request) + b"\n"
+
+    def send_async(self, method: str, params: Optional[Dict[str, Any]] = None) -> int:
+        """Send a JSON-RPC request without waiting and return its id for collect()"""
+        if self._write is None:
+            raise ConnectionError("Server not started")
+
+        request_id, line = self._encode_request(method, params)
+        self._write(line)
+        return request_id
+
+    def collect(self, ids: List[int], timeout: Optional[float] = None) -> Dict[Any, Dict[str, Any]]:
+        """Wait for the responses to the given request ids and return them keyed by id
+
+        Responses can arrive in any order; ones for other ids are kept for a
+        later call. Ids still missing when the timeout expires are left out,
+        and their replies are dropped if they turn up afterwards.
+        """
+        if self._selector is None:
+            raise ConnectionError("Server not started")
+
+        pending = {request_id for request_id in ids if request_id not in self._responses}
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # Every request gets exactly one reply, so a reply without a usable id
+        # stands in for one of the pending requests
+        orphans = 0
+
+        # After a read fills the whole buffer more data is almost certainly
+        # waiting, so the next read goes straight to the descriptor and only
+        # an empty (EAGAIN) read falls back to sleeping in the selector
+        ready = False
+        # Bound once so the loop does no attribute lookups per read
+        select = self._selector.select
+        read = self._read
+        buf = self._buf
+        parse = self._parse_responses
+        discard = pending.discard
+
+        while len(pending) > orphans:
+            if not ready:
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                if not select(remaining):
+                    continue
 
             try:
-                response = json.loads(response_line.strip())
-                return response
-            except json.JSONDecodeError:
-                return {"error": f"Invalid JSON response: {response_line.strip()[:100]}..."}
+                chunk = read()
+            except BlockingIOError:
+                ready = False
+                continue
+            if not chunk:
+                raise ConnectionError("Server closed the connection")
+            ready = len(chunk) == READ_BUFFER_SIZE
+            buf += chunk
+            for response_id in parse():
+                if response_id in pending:
+                    discard(response_id)
+                elif response_id is None:
+                    orphans += 1
+
+        self._outstanding.difference_update(ids)
+        return {request_id: self._responses.pop(request_id) for request_id in ids if request_id in self._responses}
+
+    def _parse_responses(self) -> List[Any]:
+        """Move every complete line in the read buffer into the response table"""
+        buf = self._buf
+        parsed = []
+        start = 0
+        # Resume the newline search where the previous read left off, and
+        # decode each line through a view instead of copying it out first
+        scan = self._scan
+        outstanding = self._outstanding
+        next_id = self.next_id
+        with memoryview(buf) as view:
+            while True:
+                end = buf.find(b"\n", scan)
+                if end < 0:
+                    break
+                line_start, start = start, end + 1
+                scan = start
+                if end == line_start:
+                    continue
+                with view[line_start:end] as line:
+                    try:
+                        # Both decoders ignore surrounding whitespace
+                        response = _loads(line)
+                    except ValueError:
+                        response = None
+                    if not isinstance(response, dict):
+                        # Without an id the line cannot be matched to a request; only
+                        # the error message trims, and only the first 100 bytes
+                        response = {"id": None, "error": f"Invalid JSON response: {bytes(line[:100]).decode(errors='replace').rstrip()}..."}
+                response_id = response.get("id")
+                if type(response_id) is not int or not 0 < response_id < next_id:
+                    # Not an id this client issued, so like an id-less reply it
+                    # stands in for one of the pending requests
+                    self._responses[None] = response
+                    parsed.append(None)
+                elif response_id in outstanding:
+                    self._responses[response_id] = response
+                    parsed.append(response_id)
+                # Otherwise it is a late reply to a request nobody waits for any more
+        del buf[:start]
+        # What is left is a partial line with no newline in it
+        self._scan = len(buf)
+        return parsed
+
+    def send_request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send a JSON-RPC request to the server and return the response"""
+        return self._roundtrip(*self._encode_request(method, params))
+
+    def _send_template(self, template: bytes) -> Dict[str, Any]:
+        """Send a request pre-encoded by _request_template and return the response"""
+        request_id = self._next_request_id()
+        return self._roundtrip(request_id, template % request_id)
 
+    def _roundtrip(self, request_id: int, line: bytes) -> Dict[str, Any]:
+        """Write one encoded request line and wait for its response"""
+        if self._write is None:
+            return {"error": "Server not started"}
+
+        try:
+            self._write(line)
+            responses = self.collect([request_id])
         except Exception as e:
+            self._outstanding.discard(request_id)
             return {"error": f"Failed to communicate with server: {e}"}
 
+        if request_id in responses:
+            return responses[request_id]
+        # A response the server could not tie to a request (e.g. a parse error)
+        return self._responses.pop(None, {"error": "No response from server"})
+
+    def send_batch(self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """Pipeline several requests in one write and return the responses in call order"""
+        if self._write is None:
+            return [{"error": "Server not started"} for _ in calls]
+
+        encode = self._encode_request
+        encoded = [encode(method, params) for method, params in calls]
+        ids = [request_id for request_id, _ in encoded]
+
+        try:
+            # All requests go out in a single write, then every reply is awaited at once.
+            # That leaves one select and one read per reply, because the server writes
+            # each reply as soon as it is done; io_uring could not merge those wake-ups.
+            self._write(b"".join(line for _, line in encoded))
+            responses = self.collect(ids)
+        except Exception as e:
+            self._outstanding.difference_update(ids)
+            return [{"error": f"Failed to communicate with server: {e}"} for _ in calls]
+
+        # As in _roundtrip, a reply the server could not tie to a request fills a missing slot
+        return [
+            responses[request_id] if request_id in responses
+            else self._responses.pop(None, {"error": "No response from server"})
+            for request_id in ids
+        ]
+
     def initialize(self) -> Dict[str, Any]:
         """Initialize the MCP server"""
-        return self.send_request("initialize", {
-            "protocolVersion": "2024-11-05",
-            "capabilities": {},
-            "clientInfo": {
-                "name": "python-test-client",
-                "version": "1.0.0"
-            }
-        })
+        return self._send_template(self._TMPL_INITIALIZE)
 
     def initialized(self) -> Dict[str, Any]:
         """Confirm initialization"""
-        return self.send_request("initialized")
+        return self._send_template(self._TMPL_INITIALIZED)
 
     def list_tools(self) -> Dict[str, Any]:
         """List available tools"""
-        return self.send_request("tools/list")
+        return self._send_template(self._TMPL_LIST_TOOLS)
 
     def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call a specific tool"""
@@ -106,159 +528,139 @@ class McpClient:
 
     def ping(self) -> Dict[str, Any]:
         """Ping the server"""
-        return self.send_request("ping")
+        return self._send_template(self._TMPL_PING)
+
 
+def _first_text(result: Dict[str, Any]) -> Optional[str]:
+    """Return the text of a tool result's first content item, if it is text"""
+    content = result.get("content", [])
+    if content and content[0].get("type") == "text":
+        return content[0]["text"]
+    return None
 
-def test_server_initialization(client: McpClient) -> bool:
-    """Test server initialization sequence."""
-    print("\n1. Initializing server...")
-    response = client.initialize()
-    if "error" in response:
-        print(f"❌ Error: {response['error']}")
-        return False
 
+def fmt_initialize(result: Dict[str, Any]) -> None:
+    """Summarize the protocol version and server name"""
     print("✅ Server initialized successfully")
-    print(f"   Protocol: {response.get('result', {}).get('protocolVersion', 'unknown')}")
-    print(f"   Server: {response.get('result', {}).get('serverInfo', {}).get('name', 'unknown')}")
+    print(f"   Protocol: {result.get('protocolVersion', 'unknown')}")
+    print(f"   Server: {result.get('serverInfo', {}).get('name', 'unknown')}")
 
-    print("\n2. Confirming initialization...")
-    response = client.initialized()
-    if "error" in response:
-        print(f"❌ Error: {response['error']}")
-        return False
 
+def fmt_initialized(result: Dict[str, Any]) -> None:
+    """Confirm the initialized notification went through"""
     print("✅ Initialization confirmed")
-    return True
 
 
-def test_list_tools(client: McpClient) -> bool:
-    """Test listing available tools."""
-    print("\n3. Listing available tools...")
-    response = client.list_tools()
-    if "error" in response:
-        print(f"❌ Error: {response['error']}")
-        return False
-
-    if "result" in response and "tools" in response["result"]:
-        tools = response["result"]["tools"]
+def fmt_list_tools(result: Dict[str, Any]) -> None:
+    """List each tool by name and description"""
+    if "tools" in result:
+        tools = result["tools"]
         print(f"✅ Found {len(tools)} tools:")
         for tool in tools:
             print(f"   - {tool['name']}: {tool['description']}")
 
-    return True
-
-
-def test_echo_tool(client: McpClient) -> bool:
-    """Test the echo tool."""
-    print("\n4. Testing echo tool...")
-    response = client.call_tool("echo", {"text": "Hello from Python client!"})
-    if "error" in response:
-        print(f"❌ Error: {response['error']}")
-        return False
-
-    if "result" in response:
-        content = response["result"].get("content", [])
-        if content and content[0].get("type") == "text":
-            print(f"✅ Echo response: {content[0]['text']}")
-        else:
-            print("✅ Echo tool called successfully")
-
-    return True
-
-
-def test_system_info(client: McpClient) -> bool:
-    """Test getting system information."""
-    print("\n5. Getting system information...")
-    response = client.call_tool("get_system_info", {})
-    if "error" in response:
-        print(f"❌ Error: {response['error']}")
-        return False
-
-    if "result" in response:
-        content = response["result"].get("content", [])
-        if content and content[0].get("type") == "text":
-            # Just show first line of system info
-            sys_info = content[0]["text"].split("\n")[0]
-            print(f"✅ {sys_info}")
-        else:
-            print("✅ System info retrieved successfully")
-
-    return True
-
-
-def test_file_listing(client: McpClient) -> bool:
-    """Test file listing functionality."""
-    print("\n6. Listing files in current directory...")
-    response = client.call_tool("list_files", {"path": "../"})
-    if "error" in response:
-        print(f"❌ Error: {response['error']}")
-        return False
-
-    if "result" in response:
-        content = response["result"].get("content", [])
-        if content and content[0].get("type") == "text":
-            lines = content[0]["text"].split("\n")
-            file_count = len([l for l in lines if l.strip() and not l.startswith("Files in")])
-            print(f"✅ Listed files - found {file_count} items")
-        else:
-            print("✅ File listing completed successfully")
-
-    return True
-
-
-def test_ping(client: McpClient) -> bool:
-    """Test server ping functionality."""
-    print("\n7. Testing ping...")
-    response = client.ping()
-    if "error" in response:
-        print(f"❌ Error: {response['error']}")
-        return False
 
-    if "result" in response and response["result"].get("pong"):
+def fmt_echo(result: Dict[str, Any]) -> None:
+    """Show the text the echo tool sent back"""
+    text = _first_text(result)
+    if text is not None:
+        print(f"✅ Echo response: {text}")
+    else:
+        print("✅ Echo tool called successfully")
+
+
+def fmt_system_info(result: Dict[str, Any]) -> None:
+    """Show the first line of the system information"""
+    text = _first_text(result)
+    if text is not None:
+        # Just show first line of system info
+        sys_info = text.split("\n")[0]
+        print(f"✅ {sys_info}")
+    else:
+        print("✅ System info retrieved successfully")
+
+
+def fmt_file_listing(result: Dict[str, Any]) -> None:
+    """Count the entries in a directory listing"""
+    text = _first_text(result)
+    if text is not None:
+        # The listing is a "Files in <path>:" header followed by one line per
+        # entry, so every newline introduces an entry
+        file_count = text.count("\n") if text.startswith("Files in") else 0
+        print(f"✅ Listed files - found {file_count} items")
+    else:
+        print("✅ File listing completed successfully")
+
+
+def fmt_ping(result: Dict[str, Any]) -> None:
+    """Report a successful pong"""
+    if result.get("pong"):
         print("✅ Pong! Server is responsive")
 
-    return True
-
 
-def run_all_tests(client: McpClient) -> bool:
-    """Run all test functions in sequence."""
-    test_functions = [
-        test_server_initialization,
-        test_list_tools,
-        test_echo_tool,
-        test_system_info,
-        test_file_listing,
-        test_ping,
-    ]
-
-    for test_func in test_functions:
-        if not test_func(client):
+# Each test step: (label, method, params, formatter for a successful result)
+TESTS: List[Tuple[str, str, Optional[Dict[str, Any]], Callable[[Dict[str, Any]], None]]] = [
+    ("Initializing server", "initialize", INIT_PARAMS, fmt_initialize),
+    ("Confirming initialization", "initialized", None, fmt_initialized),
+    ("Listing available tools", "tools/list", None, fmt_list_tools),
+    ("Testing echo tool", "tools/call",
+     {"name": "echo", "arguments": {"text": "Hello from Python client!"}}, fmt_echo),
+    ("Getting system information", "tools/call",
+     {"name": "get_system_info", "arguments": {}}, fmt_system_info),
+    ("Listing files in current directory", "tools/call",
+     {"name": "list_files", "arguments": {"path": "../"}}, fmt_file_listing),
+    ("Testing ping", "ping", None, fmt_ping),
+]
+
+
+def run_all_tests(client: McpClient, verbose: bool = False) -> bool:
+    """Send every test request in one pipelined batch, then check the responses in order.
+
+    Only one-line summaries are printed unless verbose is set; pretty-printing
+    whole responses such as a large file listing costs far more than the call.
+    """
+    responses = client.send_batch([(method, params) for _, method, params, _ in TESTS])
+
+    for step, ((label, _, _, formatter), response) in enumerate(zip(TESTS, responses), 1):
+        print(f"\n{step}. {label}...")
+        if "error" in response:
+            print(f"❌ Error: {response['error']}")
             return False
 
+        formatter(response.get("result") or {})
+        if verbose:
+            print(json.dumps(response, indent=2))
+
     return True
 
 
 def main() -> None:
     """Main function - simplified and delegated to smaller functions."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--socket", metavar="PATH",
+                        help="talk to the server over a Unix domain socket at PATH instead of stdio")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="print every full JSON response, not just a summary")
+    args = parser.parse_args()
+
     print("Rust MCP Server - Python Test Client")
     print("=" * 40)
 
-    client = McpClient()
+    client = McpClient(socket_path=args.socket)
 
     # Start the server
     print("Starting MCP server...")
     if not client.start_server():
         return
 
-    try:
-        if run_all_tests(client):
+    # The server process is reused for every request and stopped on exit
+    with client:
+        if run_all_tests(client, verbose=args.verbose):
             print("\n🎉 All tests completed successfully!")
         else:
             print("\n❌ Some tests failed.")
-    finally:
-        # Clean up
+
         print("\nStopping server...")
-        client.stop_server()
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 use clap::Parser;
+use std::path::PathBuf;
 use std::sync::Arc;
 use tracing::{info, warn};
 
@@ -29,12 +30,28 @@ struct Cli {
     /// Server version
     #[arg(short, long, default_value = "0.1.0")]
     version: String,
+    
+    /// Serve on a Unix domain socket at this path instead of stdio
+    #[arg(long)]
+    socket: Option<PathBuf>,
+    
+    /// Keep serving new socket connections instead of exiting after the first client
+    #[arg(long, requires = "socket")]
+    daemon: bool,
 }
 
-#[tokio::main]
-async fn main() -> anyhow::Result<()> {
-    let cli = Cli::parse();
+fn main() -> anyhow::Result<()> {
+    let runtime = tokio::runtime::Runtime::new()?;
+    let result = runtime.block_on(run(Cli::parse()));
     
+    // Dropping the runtime would wait for every blocking task, so a tool call
+    // that never returns (`tail -f`, a read from a FIFO) would keep the process
+    // alive after SIGTERM; leave those threads behind instead
+    runtime.shutdown_background();
+    result
+}
+
+async fn run(cli: Cli) -> anyhow::Result<()> {
     // Initialize tracing only if not in quiet mode
     if !cli.quiet {
         let subscriber = tracing_subscriber::fmt()
@@ -54,10 +71,13 @@ async fn main() -> anyhow::Result<()> {
     // Create the MCP server
     let mcp_server = Arc::new(McpServer::new(cli.name, cli.version));
     
-    // Create and run the stdio server
-    let stdio_server = StdioServer::new(mcp_server, cli.quiet);
+    // Run on the requested transport
+    let result = match cli.socket {
+        Some(path) => run_socket_server(mcp_server, path, cli.quiet, cli.daemon).await,
+        None => StdioServer::new(mcp_server, cli.quiet).run().await,
+    };
     
-    if let Err(e) = stdio_server.run().await {
+    if let Err(e) = result {
         if !cli.quiet {
             warn!("Server error: {}", e);
         }
@@ -68,3 +88,13 @@ async fn main() -> anyhow::Result<()> {
     }
     Ok(())
 }
+
+#[cfg(unix)]
+async fn run_socket_server(mcp_server: Arc<McpServer>, path: PathBuf, quiet: bool, daemon: bool) -> anyhow::Result<()> {
+    server::UnixSocketServer::new(mcp_server, path, quiet, daemon).run().await
+}
+
+#[cfg(not(unix))]
+async fn run_socket_server(_mcp_server: Arc<McpServer>, _path: PathBuf, _quiet: bool, _daemon: bool) -> anyhow::Result<()> {
+    Err(anyhow::anyhow!("--socket is only supported on Unix platforms"))
+}
@@ -31,43 +31,73 @@ impl McpServer {
             return Ok(None); // No response for notifications
         }
         
+        if Self::is_shared_method(&request.method) {
+            return Ok(Some(self.handle_shared_request(request).await));
+        }
+        
         let result = match request.method.as_str() {
             "initialize" => self.handle_initialize(request.params).await,
             "initialized" => self.handle_initialized().await,
+            _ => return Ok(Some(Self::method_not_found(request.id))),
+        };
+        
+        Ok(Some(Self::build_response(request.id, result)))
+    }
+    
+    /// Returns true if `method` only reads server state, so requests for it
+    /// can be handled concurrently through `handle_shared_request`.
+    pub fn is_shared_method(method: &str) -> bool {
+        matches!(
+            method,
+            "tools/list" | "tools/call" | "resources/list" | "prompts/list" | "ping"
+        )
+    }
+    
+    /// Handles a request for a read-only method without exclusive access to the server.
+    pub async fn handle_shared_request(&self, request: JsonRpcRequest) -> JsonRpcResponse {
+        debug!("Handling shared request: {} (id: {:?})", request.method, request.id);
+        
+        let result = match request.method.as_str() {
             "tools/list" => self.handle_list_tools().await,
             "tools/call" => self.handle_call_tool(request.params).await,
             "resources/list" => self.handle_list_resources().await,
             "prompts/list" => self.handle_list_prompts().await,
             "ping" => self.handle_ping().await,
-            _ => {
-                return Ok(Some(JsonRpcResponse {
-                    jsonrpc: "2.0".to_string(),
-                    id: request.id,
-                    result: None,
-                    error: Some(JsonRpcError::method_not_found()),
-                }));
-            }
+            _ => return Self::method_not_found(request.id),
         };
         
+        Self::build_response(request.id, result)
+    }
+    
+    fn build_response(id: Option<serde_json::Value>, result: Result<serde_json::Value>) -> JsonRpcResponse {
         match result {
-            Ok(value) => Ok(Some(JsonRpcResponse {
+            Ok(value) => JsonRpcResponse {
                 jsonrpc: "2.0".to_string(),
-                id: request.id,
+                id,
                 result: Some(value),
                 error: None,
-            })),
+            },
             Err(e) => {
                 debug!("Request error: {}", e);
-                Ok(Some(JsonRpcResponse {
+                JsonRpcResponse {
                     jsonrpc: "2.0".to_string(),
-                    id: request.id,
+                    id,
                     result: None,
                     error: Some(JsonRpcError::internal_error()),
-                }))
+                }
             }
         }
     }
     
+    fn method_not_found(id: Option<serde_json::Value>) -> JsonRpcResponse {
+        JsonRpcResponse {
+            jsonrpc: "2.0".to_string(),
+            id,
+            result: None,
+            error: Some(JsonRpcError::method_not_found()),
+        }
+    }
+    
     async fn handle_initialize(&mut self, params: Option<serde_json::Value>) -> Result<serde_json::Value> {
         let request: InitializeRequest = if let Some(params) = params {
             serde_json::from_value(params)?
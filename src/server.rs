@@ -2,20 +2,31 @@ use crate::mcp::McpServer;
 use crate::tools::ToolRegistry;
 use crate::types::{JsonRpcRequest, JsonRpcResponse, JsonRpcError};
 use anyhow::Result;
+use futures::stream::{FuturesUnordered, StreamExt};
 use std::sync::Arc;
-use tokio::io::{AsyncBufReadExt, AsyncWriteExt, BufReader};
-use tokio::sync::Mutex;
+use tokio::io::{AsyncBufRead, AsyncBufReadExt, AsyncWrite, AsyncWriteExt, BufReader};
+use tokio::runtime::Handle;
+use tokio::sync::{RwLock, Semaphore};
 use tracing::{debug, error, info, warn};
 
+// Only the Unix socket server needs these
+#[cfg(unix)]
+use std::{io::ErrorKind, os::unix::fs::FileTypeExt, path::{Path, PathBuf}, time::Duration};
+#[cfg(unix)]
+use tokio::{net::{UnixListener, UnixStream}, signal::unix::{signal, Signal, SignalKind}};
+
+/// Most read-only requests a single connection may have running at once
+const MAX_IN_FLIGHT: usize = 32;
+
 pub struct StdioServer {
-    mcp_server: Arc<Mutex<McpServer>>,
+    mcp_server: Arc<RwLock<McpServer>>,
     quiet: bool,
 }
 
 impl StdioServer {
     pub fn new(mcp_server: Arc<McpServer>, quiet: bool) -> Self {
         Self {
-            mcp_server: Arc::new(Mutex::new((*mcp_server).clone())),
+            mcp_server: Arc::new(RwLock::new((*mcp_server).clone())),
             quiet,
         }
     }
@@ -25,103 +36,309 @@ impl StdioServer {
             info!("Starting stdio server");
         }
         
-        let stdin = tokio::io::stdin();
-        let mut stdout = tokio::io::stdout();
-        let mut reader = BufReader::new(stdin);
-        let mut line = String::new();
+        let reader = BufReader::new(tokio::io::stdin());
+        let writer = tokio::io::stdout();
+        serve_lines(&self.mcp_server, reader, writer, self.quiet).await?;
         
-        loop {
-            line.clear();
+        if !self.quiet {
+            info!("Stdio server stopped");
+        }
+        Ok(())
+    }
+}
+
+/// Serves newline-delimited JSON-RPC over a Unix domain socket.
+///
+/// By default the server handles a single client and exits when it
+/// disconnects. In daemon mode it keeps accepting connections until
+/// interrupted, so one warm process can serve many short-lived clients.
+/// Every connection is a separate MCP session with its own state.
+#[cfg(unix)]
+pub struct UnixSocketServer {
+    mcp_server: Arc<McpServer>,
+    path: PathBuf,
+    quiet: bool,
+    daemon: bool,
+}
+
+#[cfg(unix)]
+impl UnixSocketServer {
+    pub fn new(mcp_server: Arc<McpServer>, path: PathBuf, quiet: bool, daemon: bool) -> Self {
+        Self {
+            mcp_server,
+            path,
+            quiet,
+            daemon,
+        }
+    }
+    
+    pub async fn run(&self) -> Result<()> {
+        remove_stale_socket(&self.path)?;
+        
+        let listener = UnixListener::bind(&self.path)?;
+        if !self.quiet {
+            info!("Listening on {}", self.path.display());
+        }
+        
+        // Once this is installed SIGTERM no longer kills the process, so every
+        // wait below must also watch for it
+        let mut terminate = signal(SignalKind::terminate())?;
+        
+        let result = loop {
+            let stream = tokio::select! {
+                accepted = listener.accept() => match accepted {
+                    Ok((stream, _)) => stream,
+                    Err(e) if self.daemon => {
+                        // Failures such as EMFILE or ECONNABORTED are transient;
+                        // back off briefly instead of taking the daemon down
+                        warn!("Failed to accept connection: {}", e);
+                        tokio::time::sleep(Duration::from_millis(100)).await;
+                        continue;
+                    }
+                    Err(e) => break Err(e.into()),
+                },
+                _ = shutdown_signal(&mut terminate) => break Ok(()),
+            };
+            
+            let session = Arc::new(RwLock::new((*self.mcp_server).clone()));
+            let quiet = self.quiet;
             
-            match reader.read_line(&mut line).await {
-                Ok(0) => {
-                    // EOF reached
-                    if !self.quiet {
-                        info!("Client disconnected");
+            if !self.daemon {
+                break tokio::select! {
+                    result = serve_stream(&session, stream, quiet) => result,
+                    _ = shutdown_signal(&mut terminate) => Ok(()),
+                };
+            }
+            
+            if !quiet {
+                info!("Client connected");
+            }
+            tokio::spawn(async move {
+                if let Err(e) = serve_stream(&session, stream, quiet).await {
+                    if !quiet {
+                        warn!("Connection error: {}", e);
                     }
-                    break;
                 }
-                Ok(_) => {
-                    let trimmed = line.trim();
-                    if trimmed.is_empty() {
-                        continue;
+            });
+        };
+        
+        let _ = std::fs::remove_file(&self.path);
+        if !self.quiet {
+            info!("Socket server stopped");
+        }
+        result
+    }
+}
+
+/// Resolves on Ctrl-C (SIGINT) or SIGTERM.
+#[cfg(unix)]
+async fn shutdown_signal(terminate: &mut Signal) {
+    tokio::select! {
+        _ = tokio::signal::ctrl_c() => {}
+        _ = terminate.recv() => {}
+    }
+}
+
+/// Removes a socket left behind by a previous run. Anything else at `path`
+/// (a regular file, or a socket a live server still accepts on) is an error.
+#[cfg(unix)]
+fn remove_stale_socket(path: &Path) -> Result<()> {
+    let metadata = match std::fs::symlink_metadata(path) {
+        Ok(metadata) => metadata,
+        Err(e) if e.kind() == ErrorKind::NotFound => return Ok(()),
+        Err(e) => return Err(e.into()),
+    };
+    
+    let stale = metadata.file_type().is_socket()
+        && matches!(
+            std::os::unix::net::UnixStream::connect(path),
+            Err(ref e) if e.kind() == ErrorKind::ConnectionRefused
+        );
+    if !stale {
+        return Err(std::io::Error::new(
+            ErrorKind::AddrInUse,
+            format!("{} is already in use", path.display()),
+        )
+        .into());
+    }
+    
+    std::fs::remove_file(path)?;
+    Ok(())
+}
+
+#[cfg(unix)]
+async fn serve_stream(mcp_server: &Arc<RwLock<McpServer>>, stream: UnixStream, quiet: bool) -> Result<()> {
+    let (read_half, write_half) = stream.into_split();
+    serve_lines(mcp_server, BufReader::new(read_half), write_half, quiet).await
+}
+
+/// Reads JSON-RPC requests line by line and writes one response line per request.
+///
+/// Read-only requests (see `McpServer::is_shared_method`) run concurrently and
+/// their responses are written as they complete, so a slow tool call does not
+/// hold up the ones pipelined behind it. Any other request first waits for
+/// everything in flight, then runs with exclusive access.
+async fn serve_lines<R, W>(
+    mcp_server: &Arc<RwLock<McpServer>>,
+    reader: R,
+    mut writer: W,
+    quiet: bool,
+) -> Result<()>
+where
+    R: AsyncBufRead + Unpin,
+    W: AsyncWrite + Unpin,
+{
+    let mut lines = reader.lines();
+    let mut in_flight = FuturesUnordered::new();
+    let limit = Arc::new(Semaphore::new(MAX_IN_FLIGHT));
+    
+    loop {
+        tokio::select! {
+            line = lines.next_line() => {
+                let line = match line {
+                    Ok(Some(line)) => line,
+                    Ok(None) => {
+                        // EOF reached
+                        if !quiet {
+                            info!("Client disconnected");
+                        }
+                        break;
                     }
-                    
-                    debug!("Received: {}", trimmed);
-                    
-                    let response = self.process_message(trimmed).await;
-                    
-                    // Only send response if it's not None (notifications return None)
-                    if let Some(actual_response) = response {
-                        let response_json = serde_json::to_string(&actual_response)?;
-                        
-                        debug!("Sending: {}", response_json);
-                        
-                        stdout.write_all(response_json.as_bytes()).await?;
-                        stdout.write_all(b"\n").await?;
-                        stdout.flush().await?;
+                    Err(e) => {
+                        error!("Error reading from client: {}", e);
+                        break;
                     }
+                };
+                
+                let trimmed = line.trim();
+                if trimmed.is_empty() {
+                    continue;
                 }
-                Err(e) => {
-                    error!("Error reading from stdin: {}", e);
-                    break;
+                
+                debug!("Received: {}", trimmed);
+                
+                match parse_request(trimmed) {
+                    Err(response) => write_response(&mut writer, &response).await?,
+                    Ok(request) if McpServer::is_shared_method(&request.method) => {
+                        // Waits here, without reading further lines, while this connection
+                        // already has MAX_IN_FLIGHT requests running
+                        let permit = Arc::clone(&limit).acquire_owned().await?;
+                        let id = request.id.clone();
+                        let server = Arc::clone(mcp_server);
+                        let task = if request.method == "tools/call" {
+                            // Tools use blocking std::fs and std::process calls, so they run on
+                            // the blocking pool instead of stalling a runtime worker
+                            let runtime = Handle::current();
+                            tokio::task::spawn_blocking(move || {
+                                let _permit = permit;
+                                runtime.block_on(async move {
+                                    server.read().await.handle_shared_request(request).await
+                                })
+                            })
+                        } else {
+                            tokio::spawn(async move {
+                                let _permit = permit;
+                                server.read().await.handle_shared_request(request).await
+                            })
+                        };
+                        in_flight.push(async move {
+                            task.await.unwrap_or_else(|e| {
+                                error!("Error handling request: {}", e);
+                                JsonRpcResponse {
+                                    jsonrpc: "2.0".to_string(),
+                                    id,
+                                    result: None,
+                                    error: Some(JsonRpcError::internal_error()),
+                                }
+                            })
+                        });
+                    }
+                    Ok(request) => {
+                        while let Some(response) = in_flight.next().await {
+                            write_response(&mut writer, &response).await?;
+                        }
+                        
+                        // Only send response if it's not None (notifications return None)
+                        if let Some(response) = handle_exclusive(mcp_server, request).await {
+                            write_response(&mut writer, &response).await?;
+                        }
+                    }
                 }
             }
+            Some(response) = in_flight.next(), if !in_flight.is_empty() => {
+                write_response(&mut writer, &response).await?;
+            }
         }
-        
-        if !self.quiet {
-            info!("Stdio server stopped");
-        }
-        Ok(())
     }
     
-    async fn process_message(&self, message: &str) -> Option<JsonRpcResponse> {
-        // Parse the JSON-RPC request
-        let request: JsonRpcRequest = match serde_json::from_str(message) {
-            Ok(req) => req,
-            Err(e) => {
-                warn!("Failed to parse JSON-RPC request: {}", e);
-                return Some(JsonRpcResponse {
-                    jsonrpc: "2.0".to_string(),
-                    id: None,
-                    result: None,
-                    error: Some(JsonRpcError::parse_error()),
-                });
-            }
-        };
-        
-        // Validate JSON-RPC version
-        if request.jsonrpc != "2.0" {
-            return Some(JsonRpcResponse {
+    // Answer whatever was still running when the client stopped sending
+    while let Some(response) = in_flight.next().await {
+        write_response(&mut writer, &response).await?;
+    }
+    
+    Ok(())
+}
+
+async fn write_response<W: AsyncWrite + Unpin>(writer: &mut W, response: &JsonRpcResponse) -> Result<()> {
+    let response_json = serde_json::to_string(response)?;
+    
+    debug!("Sending: {}", response_json);
+    
+    writer.write_all(response_json.as_bytes()).await?;
+    writer.write_all(b"\n").await?;
+    writer.flush().await?;
+    Ok(())
+}
+
+fn parse_request(message: &str) -> std::result::Result<JsonRpcRequest, JsonRpcResponse> {
+    // Parse the JSON-RPC request
+    let request: JsonRpcRequest = match serde_json::from_str(message) {
+        Ok(req) => req,
+        Err(e) => {
+            warn!("Failed to parse JSON-RPC request: {}", e);
+            return Err(JsonRpcResponse {
                 jsonrpc: "2.0".to_string(),
-                id: request.id,
+                id: None,
                 result: None,
-                error: Some(JsonRpcError::invalid_request()),
+                error: Some(JsonRpcError::parse_error()),
             });
         }
-        
-        // Handle the request
-        let mut server = self.mcp_server.lock().await;
-        match server.handle_request(request).await {
-            Ok(Some(response)) => Some(response),
-            Ok(None) => {
-                // No response needed (notification)
-                None
-            },
-            Err(e) => {
-                error!("Error handling request: {}", e);
-                Some(JsonRpcResponse {
-                    jsonrpc: "2.0".to_string(),
-                    id: None,
-                    result: None,
-                    error: Some(JsonRpcError::internal_error()),
-                })
-            }
+    };
+    
+    // Validate JSON-RPC version
+    if request.jsonrpc != "2.0" {
+        return Err(JsonRpcResponse {
+            jsonrpc: "2.0".to_string(),
+            id: request.id,
+            result: None,
+            error: Some(JsonRpcError::invalid_request()),
+        });
+    }
+    
+    Ok(request)
+}
+
+async fn handle_exclusive(mcp_server: &RwLock<McpServer>, request: JsonRpcRequest) -> Option<JsonRpcResponse> {
+    let mut server = mcp_server.write().await;
+    match server.handle_request(request).await {
+        Ok(Some(response)) => Some(response),
+        Ok(None) => {
+            // No response needed (notification)
+            None
+        },
+        Err(e) => {
+            error!("Error handling request: {}", e);
+            Some(JsonRpcResponse {
+                jsonrpc: "2.0".to_string(),
+                id: None,
+                result: None,
+                error: Some(JsonRpcError::internal_error()),
+            })
         }
     }
 }
 
-// We need to implement Clone for McpServer to use it with Arc<Mutex<>>
+// Each connection gets its own copy of McpServer behind an Arc<RwLock<>>
 impl Clone for McpServer {
     fn clone(&self) -> Self {
         Self {
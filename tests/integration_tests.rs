@@ -148,3 +148,265 @@ async fn test_ping() {
         assert_eq!(ping_response["pong"], json!(true));
     }
 }
+
+#[tokio::test]
+async fn test_shared_request() {
+    // Read-only methods are served through a shared reference
+    let server = McpServer::new("test-server".to_string(), "1.0.0".to_string());
+    assert!(McpServer::is_shared_method("tools/call"));
+    assert!(McpServer::is_shared_method("ping"));
+    assert!(!McpServer::is_shared_method("initialize"));
+
+    let request = JsonRpcRequest {
+        jsonrpc: "2.0".to_string(),
+        id: Some(json!(7)),
+        method: "ping".to_string(),
+        params: None,
+    };
+
+    let response = server.handle_shared_request(request).await;
+
+    assert_eq!(response.id, Some(json!(7)));
+    assert_eq!(response.result, Some(json!({"pong": true})));
+    assert!(response.error.is_none());
+}
+
+#[cfg(unix)]
+async fn connect_with_retry(path: &std::path::Path) -> tokio::net::UnixStream {
+    // Wait for the listener to come up
+    for _ in 0..100 {
+        if let Ok(stream) = tokio::net::UnixStream::connect(path).await {
+            return stream;
+        }
+        tokio::time::sleep(std::time::Duration::from_millis(10)).await;
+    }
+    panic!("socket server did not start");
+}
+
+#[cfg(unix)]
+async fn socket_ping(stream: tokio::net::UnixStream, id: i64) -> JsonRpcResponse {
+    use tokio::io::{AsyncBufReadExt, AsyncWriteExt, BufReader};
+
+    let (read_half, mut write_half) = stream.into_split();
+    let request = format!("{{\"jsonrpc\":\"2.0\",\"id\":{},\"method\":\"ping\"}}\n", id);
+    write_half.write_all(request.as_bytes()).await.unwrap();
+
+    let mut line = String::new();
+    BufReader::new(read_half).read_line(&mut line).await.unwrap();
+    serde_json::from_str(&line).unwrap()
+}
+
+#[cfg(unix)]
+async fn next_response<R>(lines: &mut tokio::io::Lines<R>) -> JsonRpcResponse
+where
+    R: tokio::io::AsyncBufRead + Unpin,
+{
+    let line = tokio::time::timeout(std::time::Duration::from_secs(5), lines.next_line())
+        .await
+        .expect("timed out waiting for a response")
+        .unwrap()
+        .unwrap();
+    serde_json::from_str(&line).unwrap()
+}
+
+#[cfg(unix)]
+#[tokio::test]
+async fn test_unix_socket_server_ping() {
+    use rust_mcp_server::server::UnixSocketServer;
+    use std::sync::Arc;
+
+    let path = std::env::temp_dir().join(format!("rust-mcp-server-test-{}.sock", std::process::id()));
+    let server = Arc::new(McpServer::new("test-server".to_string(), "1.0.0".to_string()));
+    let socket_server = UnixSocketServer::new(server, path.clone(), true, false);
+    let handle = tokio::spawn(async move { socket_server.run().await });
+
+    let response = socket_ping(connect_with_retry(&path).await, 6).await;
+
+    assert_eq!(response.id, Some(json!(6)));
+    assert_eq!(response.result, Some(json!({"pong": true})));
+
+    // Closing the connection stops the server and removes the socket file
+    handle.await.unwrap().unwrap();
+    assert!(!path.exists());
+}
+
+#[cfg(unix)]
+#[tokio::test]
+async fn test_unix_socket_daemon_serves_many_clients() {
+    use rust_mcp_server::server::UnixSocketServer;
+    use std::sync::Arc;
+
+    let path = std::env::temp_dir().join(format!("rust-mcp-server-daemon-test-{}.sock", std::process::id()));
+    let server = Arc::new(McpServer::new("test-server".to_string(), "1.0.0".to_string()));
+    let socket_server = UnixSocketServer::new(server, path.clone(), true, true);
+    let handle = tokio::spawn(async move { socket_server.run().await });
+
+    // The daemon keeps listening after each client disconnects
+    for id in 1..=3 {
+        let response = socket_ping(connect_with_retry(&path).await, id).await;
+        assert_eq!(response.id, Some(json!(id)));
+        assert_eq!(response.result, Some(json!({"pong": true})));
+    }
+
+    handle.abort();
+    let _ = std::fs::remove_file(&path);
+}
+
+#[cfg(unix)]
+#[tokio::test]
+async fn test_unix_socket_server_pipelined_requests() {
+    use rust_mcp_server::server::UnixSocketServer;
+    use std::sync::Arc;
+    use tokio::io::{AsyncBufReadExt, AsyncWriteExt, BufReader};
+
+    let path = std::env::temp_dir().join(format!("rust-mcp-server-pipeline-test-{}.sock", std::process::id()));
+    let server = Arc::new(McpServer::new("test-server".to_string(), "1.0.0".to_string()));
+    let socket_server = UnixSocketServer::new(server, path.clone(), true, false);
+    let handle = tokio::spawn(async move { socket_server.run().await });
+
+    // Reading a FIFO blocks until a writer shows up, which makes for a slow tool call
+    let fifo = std::env::temp_dir().join(format!("rust-mcp-server-pipeline-test-{}.fifo", std::process::id()));
+    let _ = std::fs::remove_file(&fifo);
+    assert!(std::process::Command::new("mkfifo").arg(&fifo).status().unwrap().success());
+
+    let (read_half, mut write_half) = connect_with_retry(&path).await.into_split();
+    let call = json!({
+        "jsonrpc": "2.0",
+        "id": 3,
+        "method": "tools/call",
+        "params": {"name": "read_file", "arguments": {"path": fifo.to_str().unwrap()}}
+    });
+    let requests = format!(
+        "{}\n{}\n{}\n{}\n",
+        r#"{"jsonrpc":"2.0","id":1,"method":"initialize","params":{"protocolVersion":"2024-11-05","capabilities":{},"clientInfo":{"name":"test-client","version":"1.0.0"}}}"#,
+        r#"{"jsonrpc":"2.0","id":2,"method":"tools/list"}"#,
+        call,
+        r#"{"jsonrpc":"2.0","id":4,"method":"ping"}"#,
+    );
+    write_half.write_all(requests.as_bytes()).await.unwrap();
+
+    let mut lines = BufReader::new(read_half).lines();
+
+    // initialize finishes before the tools/list pipelined behind it runs
+    let response = next_response(&mut lines).await;
+    assert_eq!(response.id, Some(json!(1)));
+    assert!(response.result.is_some());
+    let response = next_response(&mut lines).await;
+    assert_eq!(response.id, Some(json!(2)));
+    assert!(response.result.unwrap()["tools"].is_array());
+
+    // The ping is answered while the earlier tool call is still blocked
+    let response = next_response(&mut lines).await;
+    assert_eq!(response.id, Some(json!(4)));
+    assert_eq!(response.result, Some(json!({"pong": true})));
+
+    let writer = fifo.clone();
+    tokio::task::spawn_blocking(move || std::fs::write(writer, "unblocked")).await.unwrap().unwrap();
+    let response = next_response(&mut lines).await;
+    assert_eq!(response.id, Some(json!(3)));
+    assert!(response.result.unwrap().to_string().contains("unblocked"));
+
+    drop(write_half);
+    handle.await.unwrap().unwrap();
+    std::fs::remove_file(&fifo).unwrap();
+}
+
+#[cfg(unix)]
+#[test]
+fn test_unix_socket_server_exits_on_sigterm_with_blocked_tool() {
+    use std::io::{BufRead, BufReader, Write};
+    use std::os::unix::net::UnixStream;
+    use std::process::{Command, Stdio};
+    use std::time::{Duration, Instant};
+
+    let path = std::env::temp_dir().join(format!("rust-mcp-server-sigterm-test-{}.sock", std::process::id()));
+    let fifo = std::env::temp_dir().join(format!("rust-mcp-server-sigterm-test-{}.fifo", std::process::id()));
+    let _ = std::fs::remove_file(&fifo);
+    assert!(Command::new("mkfifo").arg(&fifo).status().unwrap().success());
+
+    let mut child = Command::new(env!("CARGO_BIN_EXE_rust-mcp-server"))
+        .arg("--quiet")
+        .arg("--socket")
+        .arg(&path)
+        .stdin(Stdio::null())
+        .spawn()
+        .unwrap();
+
+    let mut stream = None;
+    for _ in 0..100 {
+        if let Ok(connected) = UnixStream::connect(&path) {
+            stream = Some(connected);
+            break;
+        }
+        std::thread::sleep(Duration::from_millis(10));
+    }
+    let mut stream = stream.expect("socket server did not start");
+
+    // The read_file call blocks on the FIFO; the ping answered behind it shows
+    // the call is in flight when the signal arrives
+    let call = json!({
+        "jsonrpc": "2.0",
+        "id": 2,
+        "method": "tools/call",
+        "params": {"name": "read_file", "arguments": {"path": fifo.to_str().unwrap()}}
+    });
+    write!(
+        stream,
+        "{}\n{}\n{}\n",
+        r#"{"jsonrpc":"2.0","id":1,"method":"initialize","params":{"protocolVersion":"2024-11-05","capabilities":{},"clientInfo":{"name":"test-client","version":"1.0.0"}}}"#,
+        call,
+        r#"{"jsonrpc":"2.0","id":3,"method":"ping"}"#,
+    )
+    .unwrap();
+    stream.set_read_timeout(Some(Duration::from_secs(5))).unwrap();
+    let mut reader = BufReader::new(&stream);
+    for id in [1, 3] {
+        let mut line = String::new();
+        reader.read_line(&mut line).unwrap();
+        let response: JsonRpcResponse = serde_json::from_str(&line).unwrap();
+        assert_eq!(response.id, Some(json!(id)));
+    }
+
+    assert!(Command::new("kill").arg("-TERM").arg(child.id().to_string()).status().unwrap().success());
+
+    let deadline = Instant::now() + Duration::from_secs(5);
+    let status = loop {
+        if let Some(status) = child.try_wait().unwrap() {
+            break status;
+        }
+        if Instant::now() > deadline {
+            child.kill().unwrap();
+            child.wait().unwrap();
+            panic!("server did not exit on SIGTERM while a tool call was blocked");
+        }
+        std::thread::sleep(Duration::from_millis(10));
+    };
+    assert!(status.success());
+    assert!(!path.exists());
+    std::fs::remove_file(&fifo).unwrap();
+}
+
+#[cfg(unix)]
+#[tokio::test]
+async fn test_unix_socket_server_keeps_existing_files() {
+    use rust_mcp_server::server::UnixSocketServer;
+    use std::sync::Arc;
+
+    let server = Arc::new(McpServer::new("test-server".to_string(), "1.0.0".to_string()));
+
+    // A regular file at the socket path is never removed
+    let path = std::env::temp_dir().join(format!("rust-mcp-server-file-test-{}.sock", std::process::id()));
+    std::fs::write(&path, "not a socket").unwrap();
+    let result = UnixSocketServer::new(server.clone(), path.clone(), true, false).run().await;
+    assert!(result.is_err());
+    assert_eq!(std::fs::read_to_string(&path).unwrap(), "not a socket");
+    std::fs::remove_file(&path).unwrap();
+
+    // Neither is the socket of a server that is still listening
+    let path = std::env::temp_dir().join(format!("rust-mcp-server-live-test-{}.sock", std::process::id()));
+    let _listener = tokio::net::UnixListener::bind(&path).unwrap();
+    let result = UnixSocketServer::new(server, path.clone(), true, false).run().await;
+    assert!(result.is_err());
+    assert!(path.exists());
+    std::fs::remove_file(&path).unwrap();
+}